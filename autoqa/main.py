@@ -12,6 +12,7 @@ from reportportal_client.helpers import timestamp
 
 from utils import scan_test_files
 from test_runner import run_single_test_with_timeout
+from reportportal_handler import tune_rp_session
 
 # Configure logging
 logging.basicConfig(
@@ -365,7 +366,10 @@ async def main():
                     project=args.rp_project,
                     api_key=args.rp_token
                 )
-                
+
+                # Amortize TLS handshakes across all log/attachment uploads
+                tune_rp_session(rp_client)
+
                 # Start ReportPortal launch
                 current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
                 
@@ -1,14 +1,149 @@
+import asyncio
+import functools
+import hashlib
 import os
 import json
-import mimetypes
+import mmap
 import re
 import logging
-import glob
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from reportportal_client.helpers import timestamp
 
+# Optional faster JSON parsers - fall back to stdlib json when unavailable
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Resolved once - platform.system() hits uname() on every call
+_SYSTEM = platform.system().lower()
+
+# Replay accumulated log entries in chunks of this size so attachment
+# bytes aren't held in memory for a whole turn at once
+LOG_BATCH_SIZE = 20
+
+# Concurrent turn uploads - each turn is dominated by RP round-trip latency
+TURN_UPLOAD_WORKERS = 4
+
+# JSON files above this size are sent as attachments instead of being
+# embedded in the log message body
+JSON_INLINE_LIMIT = 64 * 1024
+
+# Content keys of log files already uploaded this run, so rotated
+# duplicates and repeated symlinks aren't uploaded twice
+_uploaded_log_keys = set()
+_UPLOADED_LOG_KEYS_MAX = 64
+
+# Matches {"result": True} / {"result": False} markers in response content
+# Compiled once at module load; re.ASCII enables the faster ASCII paths
+_RESULT_RE = re.compile(r'\{\s*"result"\s*:\s*(True|False)\s*\}', re.ASCII)
+
+# Bytes variant for scanning raw response files, where the marker sits inside
+# a JSON string and its quotes are backslash-escaped
+_RESULT_RE_BYTES = re.compile(rb'\{\s*\\?"result\\?"\s*:\s*(True|False)\s*\}', re.ASCII)
+
+# How much of a response file to scan from the end before falling back to a
+# full parse - the result marker lives in the last assistant message
+_RESULT_TAIL_BYTES = 64 * 1024
+
+def _video_mime(video_path):
+    """
+    Mime type for a recording - mp4 recordings were previously labelled as
+    AVI, which forces some RP UI players to re-encode before playback
+    """
+    return "video/mp4" if video_path.endswith(".mp4") else "video/x-msvideo"
+
+def _log_file_attachment(client, item_id, message, attachment_name, file_path, mime):
+    """
+    Attach a file to a ReportPortal log entry
+    Passes the content as bytes: the client queues log requests in its
+    internal batcher and sends them later, so attachment data must stay
+    valid after this call returns - file-likes/mmaps closed here would be
+    read after closing and silently dropped
+    """
+    with open(file_path, "rb") as f:
+        data = f.read(os.fstat(f.fileno()).st_size)
+    client.log(
+        time=timestamp(),
+        level="INFO",
+        message=message,
+        item_id=item_id,
+        attachment={
+            "name": attachment_name,
+            "data": data,
+            "mime": mime
+        }
+    )
+
+def _list_turn_dirs(trajectory_dir):
+    """
+    List turn_* subdirectories of a trajectory using a single scandir pass
+    Returns DirEntry objects sorted by name (cached stat, no extra syscalls)
+    """
+    with os.scandir(trajectory_dir) as it:
+        return sorted(
+            (e for e in it if e.name.startswith("turn_") and e.is_dir(follow_symlinks=False)),
+            key=lambda e: e.name
+        )
+
+def tune_rp_session(client):
+    """
+    Mount a pooled HTTP adapter with keep-alive and retries on the RP
+    client's session, amortizing TLS handshakes across the many
+    log/attachment requests this module issues
+    """
+    try:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = getattr(client, "session", None)
+        if session is None:
+            logger.debug("ReportPortal client exposes no session, skipping HTTP tuning")
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        logger.info("Configured ReportPortal session with pooled keep-alive connections")
+    except Exception as e:
+        logger.warning(f"Could not tune ReportPortal HTTP session: {e}")
+
+def _flush_log_entries(client, entries):
+    """
+    Send accumulated log entries to ReportPortal
+    The pinned client has no public batch API but already batches log
+    requests internally, so entries are replayed individually; a failing
+    entry is reported to RP and doesn't abort the rest of the chunk
+    """
+    for entry in entries:
+        try:
+            client.log(**entry)
+        except Exception as e:
+            logger.error(f"Error sending log entry to ReportPortal: {e}")
+            try:
+                client.log(
+                    time=entry.get("time") or timestamp(),
+                    level="ERROR",
+                    message=f"[ERROR uploading {entry.get('message', '')[:80]}] {str(e)}",
+                    item_id=entry.get("item_id")
+                )
+            except Exception:
+                logger.error("Could not report the failed log entry to ReportPortal")
+    entries.clear()
+
 def upload_turn_folder(client, test_item_id, turn_path, turn_name, force_fail=False):
     """
     Upload turn folder content to ReportPortal
@@ -22,61 +157,93 @@ def upload_turn_folder(client, test_item_id, turn_path, turn_name, force_fail=Fa
 
     uploaded = False
     step_has_errors = False  # Track if this step has any errors
-    
-    for fname in sorted(os.listdir(turn_path)):
-        fpath = os.path.join(turn_path, fname)
+    entries = []  # Accumulated log entries, flushed in batches
+
+    with os.scandir(turn_path) as it:
+        turn_files = sorted(it, key=lambda e: e.name)
+
+    for entry in turn_files:
+        # DirEntry.path comes for free from the scan - no per-file join
+        fname = entry.name
+        fpath = entry.path
+        # One timestamp per file - every entry synthesized from it shares it
+        now = timestamp()
 
         if fname.endswith(".json"):
             try:
-                with open(fpath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                client.log(
-                    time=timestamp(),
-                    level="INFO",
-                    message=f"[{fname}]\n{json.dumps(data, indent=2)}",
-                    item_id=step_item_id
-                )
+                # The file is already JSON - embed it verbatim instead of
+                # paying for a parse + re-serialization round trip
+                with open(fpath, "rb") as f:
+                    raw = f.read()
+                if len(raw) > JSON_INLINE_LIMIT:
+                    # Large payloads go up as attachments; embedding them in
+                    # the message would copy megabytes into the batch body
+                    entries.append({
+                        "time": now,
+                        "level": "INFO",
+                        "message": f"[{fname}]",
+                        "item_id": step_item_id,
+                        "attachment": {
+                            "name": fname,
+                            "data": raw,
+                            "mime": "application/json"
+                        }
+                    })
+                else:
+                    entries.append({
+                        "time": now,
+                        "level": "INFO",
+                        "message": f"[{fname}]\n{raw.decode('utf-8', 'replace')}",
+                        "item_id": step_item_id
+                    })
                 uploaded = True
             except Exception as e:
-                client.log(
-                    time=timestamp(),
-                    level="ERROR",
-                    message=f"[ERROR parsing {fname}] {str(e)}",
-                    item_id=step_item_id
-                )
+                entries.append({
+                    "time": now,
+                    "level": "ERROR",
+                    "message": f"[ERROR reading {fname}] {str(e)}",
+                    "item_id": step_item_id
+                })
                 step_has_errors = True
 
         elif fname.endswith(".png"):
             try:
                 with open(fpath, "rb") as img_file:
-                    client.log(
-                        time=timestamp(),
-                        level="INFO",
-                        message=f"Screenshot: {fname}",
-                        item_id=step_item_id,
-                        attachment={
+                    entries.append({
+                        "time": now,
+                        "level": "INFO",
+                        "message": f"Screenshot: {fname}",
+                        "item_id": step_item_id,
+                        "attachment": {
                             "name": fname,
                             "data": img_file.read(),
-                            "mime": mimetypes.guess_type(fname)[0] or "image/png"
+                            "mime": "image/png"
                         }
-                    )
+                    })
                 uploaded = True
             except Exception as e:
-                client.log(
-                    time=timestamp(),
-                    level="ERROR",
-                    message=f"[ERROR attaching {fname}] {str(e)}",
-                    item_id=step_item_id
-                )
+                entries.append({
+                    "time": now,
+                    "level": "ERROR",
+                    "message": f"[ERROR attaching {fname}] {str(e)}",
+                    "item_id": step_item_id
+                })
                 step_has_errors = True
 
+        # Flush in chunks to keep the multipart body size bounded
+        if len(entries) >= LOG_BATCH_SIZE:
+            _flush_log_entries(client, entries)
+
     if not uploaded:
-        client.log(
-            time=timestamp(),
-            level="WARNING",
-            message="No data found in this turn.",
-            item_id=step_item_id
-        )
+        entries.append({
+            "time": timestamp(),
+            "level": "WARNING",
+            "message": "No data found in this turn.",
+            "item_id": step_item_id
+        })
+
+    # Flush any remaining entries in a single batched request
+    _flush_log_entries(client, entries)
 
     # Determine step status based on test case result
     if force_fail:
@@ -90,71 +257,128 @@ def upload_turn_folder(client, test_item_id, turn_path, turn_name, force_fail=Fa
         status=step_status
     )
 
-def extract_test_result_from_trajectory(trajectory_dir):
+def _find_result_in_bytes(buf):
+    """
+    C-speed scan of a bytes buffer for the result marker. bytes.rfind is a
+    memchr-backed prefilter, so buffers without the marker never reach the
+    regex engine; matching then runs only on a small window around each
+    candidate, scanning backwards from the end
+    """
+    idx = buf.rfind(b'"result')
+    while idx != -1:
+        match = _RESULT_RE_BYTES.search(buf[max(0, idx - 8):idx + 64])
+        if match:
+            return match.group(1) == b"True"
+        idx = buf.rfind(b'"result', 0, idx)
+    return None
+
+def _scan_result_marker_tail(response_file_path):
+    """
+    Look for the result marker in the tail of a response file without
+    parsing it. The marker is emitted in the final assistant message, so a
+    bounded scan of the last 64 KB finds it in O(1) regardless of file size.
+    Returns True/False when found, None when absent (caller falls back to a
+    full parse)
+    """
+    try:
+        with open(response_file_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                tail = mm[-_RESULT_TAIL_BYTES:] if len(mm) > _RESULT_TAIL_BYTES else mm[:]
+            finally:
+                mm.close()
+        return _find_result_in_bytes(tail)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Tail scan failed for {response_file_path}: {e}")
+    return None
+
+def _read_last_response_content(response_file_path):
+    """
+    Extract response.choices[-1].message.content from an API response file
+    Streams the JSON with ijson when available so large payloads (prompt,
+    usage, tool arrays) are never materialized; otherwise does a single
+    full parse with orjson or stdlib json. Returns None if not found.
+    """
+    if ijson is not None:
+        # Stream only the content fields, keeping the last one yielded
+        with open(response_file_path, 'rb') as f:
+            content = None
+            for value in ijson.items(f, 'response.choices.item.message.content'):
+                content = value
+            return content
+
+    with open(response_file_path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    if 'response' in data and 'choices' in data['response'] and data['response']['choices']:
+        last_choice = data['response']['choices'][-1]
+        if 'message' in last_choice and 'content' in last_choice['message']:
+            return last_choice['message']['content']
+    return None
+
+def extract_test_result_from_trajectory(trajectory_dir, turn_dirs=None):
     """
     Extract test result from the last turn's API response
     Returns True only if found {"result": True}, False for all other cases including {"result": False}
+    Accepts an optional pre-computed turn_dirs listing (from _list_turn_dirs)
+    so callers that already scanned the trajectory avoid a second scan
     """
     if not trajectory_dir or not os.path.exists(trajectory_dir):
         logger.warning(f"Trajectory directory not found: {trajectory_dir}")
         return False
-    
+
     try:
-        # Get all turn folders and find the last one
-        turn_folders = [f for f in os.listdir(trajectory_dir) 
-                       if os.path.isdir(os.path.join(trajectory_dir, f)) and f.startswith("turn_")]
-        
-        if not turn_folders:
+        # Get all turn folders in a single scandir pass and find the last one
+        if turn_dirs is None:
+            turn_dirs = _list_turn_dirs(trajectory_dir)
+
+        if not turn_dirs:
             logger.warning("No turn folders found")
             return False
-        
-        # Sort to get the last turn
-        last_turn = sorted(turn_folders)[-1]
-        last_turn_path = os.path.join(trajectory_dir, last_turn)
-        
-        logger.info(f"Checking result in last turn: {last_turn}")
-        
-        # Look for API call response files
-        response_files = [f for f in os.listdir(last_turn_path) 
-                         if f.startswith("api_call_") and f.endswith("_response.json")]
-        
+
+        # Already sorted, take the last turn
+        last_turn = turn_dirs[-1]
+        last_turn_path = last_turn.path
+
+        logger.info(f"Checking result in last turn: {last_turn.name}")
+
+        # Look for API call response files (single scandir pass)
+        with os.scandir(last_turn_path) as it:
+            response_files = [e.path for e in it
+                             if e.name.startswith("api_call_") and e.name.endswith("_response.json")]
+
         if not response_files:
             logger.warning("No API response files found in last turn")
             return False
-        
+
         # Check the last response file
-        last_response_file = sorted(response_files)[-1]
-        response_file_path = os.path.join(last_turn_path, last_response_file)
-        
-        logger.info(f"Checking response file: {last_response_file}")
-        
-        with open(response_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Extract content from response
-        if 'response' in data and 'choices' in data['response'] and data['response']['choices']:
-            last_choice = data['response']['choices'][-1]
-            if 'message' in last_choice and 'content' in last_choice['message']:
-                content = last_choice['message']['content']
-                logger.info(f"Last response content: {content}")
-                
-                # Look for result patterns - need to check both True and False
-                true_pattern = r'\{\s*"result"\s*:\s*True\s*\}'
-                false_pattern = r'\{\s*"result"\s*:\s*False\s*\}'
-                
-                true_match = re.search(true_pattern, content)
-                false_match = re.search(false_pattern, content)
-                
-                if true_match:
-                    logger.info(f"Found test result: True - PASSED")
-                    return True
-                elif false_match:
-                    logger.info(f"Found test result: False - FAILED")
-                    return False
-                else:
-                    logger.warning("No valid result pattern found in response content - marking as FAILED")
-                    return False
-        
+        response_file_path = sorted(response_files)[-1]
+
+        logger.info(f"Checking response file: {os.path.basename(response_file_path)}")
+
+        # Fast path: bounded scan of the file tail for the result marker,
+        # skipping the JSON parse entirely when it's found
+        tail_result = _scan_result_marker_tail(response_file_path)
+        if tail_result is not None:
+            logger.info(f"Found test result in file tail: {tail_result} - "
+                        f"{'PASSED' if tail_result else 'FAILED'}")
+            return tail_result
+
+        content = _read_last_response_content(response_file_path)
+        if content is not None:
+            logger.info(f"Last response content: {content}")
+
+            # Look for the result marker - single scan for both True and False
+            match = _RESULT_RE.search(content)
+            if match:
+                result = match.group(1) == "True"
+                logger.info(f"Found test result: {match.group(1)} - {'PASSED' if result else 'FAILED'}")
+                return result
+            else:
+                logger.warning("No valid result pattern found in response content - marking as FAILED")
+                return False
+
         logger.warning("Could not extract content from response structure")
         return False
         
@@ -162,123 +386,168 @@ def extract_test_result_from_trajectory(trajectory_dir):
         logger.error(f"Error extracting test result: {e}")
         return False
 
+def _log_content_key(log_file, file_size):
+    """
+    Cheap identity key for a log file: its size plus a blake2b digest of
+    the first and last 64 KB. Enough to catch rotated copies without
+    hashing the full content
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(log_file, "rb") as f:
+        h.update(f.read(65536))
+        if file_size > 131072:
+            f.seek(-65536, os.SEEK_END)
+        h.update(f.read(65536))
+    return (file_size, h.digest())
+
+@functools.lru_cache(maxsize=2)
 def get_jan_log_paths(is_nightly=False):
     """
     Get Jan application log file paths based on OS and version (nightly vs regular)
     Returns list of glob patterns for log files
+    Cached per version since the OS and home directory don't change mid-run
     """
-    system = platform.system().lower()
     app_name = "Jan-nightly" if is_nightly else "Jan"
-    
-    if system == "windows":
+
+    if _SYSTEM == "windows":
         # Windows: %APPDATA%\Jan(-nightly)\data\logs\*.log
         appdata = os.path.expandvars("%APPDATA%")
         return [f"{appdata}\\{app_name}\\data\\logs\\*.log"]
-    
-    elif system == "darwin":  # macOS
+
+    elif _SYSTEM == "darwin":  # macOS
         # macOS: ~/Library/Application Support/Jan(-nightly)/data/logs/*.log
         home_dir = os.path.expanduser("~")
         return [f"{home_dir}/Library/Application Support/{app_name}/data/logs/*.log"]
-    
-    elif system == "linux":
+
+    elif _SYSTEM == "linux":
         # Linux: ~/.local/share/Jan(-nightly)/data/logs/*.log
         home_dir = os.path.expanduser("~")
         return [f"{home_dir}/.local/share/{app_name}/data/logs/*.log"]
-    
+
     else:
-        logger.warning(f"Unsupported OS: {system}")
+        logger.warning(f"Unsupported OS: {_SYSTEM}")
         return []
 
-def upload_jan_logs(client, test_item_id, is_nightly=False, max_log_files=5):
+def upload_jan_logs(client, test_item_id, is_nightly=False, max_log_files=5, status_lines=None):
     """
     Upload Jan application log files to ReportPortal
+    Informational/warning notes are appended to status_lines when given,
+    so the caller can post them as one combined log entry; errors still
+    go out inline
     """
+    def note(message, level="WARNING"):
+        if status_lines is not None:
+            status_lines.append(message)
+        else:
+            client.log(
+                time=timestamp(),
+                level=level,
+                message=message,
+                item_id=test_item_id
+            )
+
     log_patterns = get_jan_log_paths(is_nightly)
     app_type = "nightly" if is_nightly else "regular"
-    
+
     logger.info(f"Looking for Jan {app_type} logs...")
-    
+
+    # Collect (mtime, path, size) in a single scandir pass per log directory;
+    # DirEntry.stat() is cached, so the sort key and size check are free
     all_log_files = []
     for pattern in log_patterns:
+        log_dir = os.path.dirname(pattern)
         try:
-            log_files = glob.glob(pattern)
-            all_log_files.extend(log_files)
-            logger.info(f"Found {len(log_files)} log files matching pattern: {pattern}")
+            with os.scandir(log_dir) as it:
+                found = [(e.stat().st_mtime, e.path, e.stat().st_size)
+                         for e in it if e.name.endswith(".log") and e.is_file()]
+            all_log_files.extend(found)
+            logger.info(f"Found {len(found)} log files in: {log_dir}")
+        except FileNotFoundError:
+            logger.info(f"Log directory not found: {log_dir}")
         except Exception as e:
-            logger.error(f"Error searching for logs with pattern {pattern}: {e}")
+            logger.error(f"Error searching for logs in {log_dir}: {e}")
     
     if not all_log_files:
         logger.warning(f"No Jan {app_type} log files found")
-        client.log(
-            time=timestamp(),
-            level="WARNING",
-            message=f"[INFO] No Jan {app_type} application logs found",
-            item_id=test_item_id
-        )
+        note(f"[INFO] No Jan {app_type} application logs found")
         return
     
     # Sort by modification time (newest first) and limit to max_log_files
     try:
-        all_log_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        all_log_files.sort(reverse=True)
         log_files_to_upload = all_log_files[:max_log_files]
-        
+
         logger.info(f"Uploading {len(log_files_to_upload)} most recent Jan {app_type} log files")
-        
-        for i, log_file in enumerate(log_files_to_upload, 1):
+
+        uploaded_count = 0  # Actual uploads, excluding size/duplicate skips
+        for i, (_, log_file, file_size) in enumerate(log_files_to_upload, 1):
+            # One timestamp per file, shared by every entry it produces
+            now = timestamp()
             try:
-                file_size = os.path.getsize(log_file)
                 file_name = os.path.basename(log_file)
                 
                 # Check file size limit (50MB = 50 * 1024 * 1024 bytes)
                 max_file_size = 50 * 1024 * 1024  # 50MB
                 if file_size > max_file_size:
                     logger.warning(f"Log file {file_name} is too large ({file_size} bytes > {max_file_size} bytes), skipping upload")
-                    client.log(
-                        time=timestamp(),
-                        level="WARNING",
-                        message=f"[INFO] Log file {file_name} skipped (size: {file_size} bytes > 50MB limit)",
-                        item_id=test_item_id
-                    )
+                    note(f"[INFO] Log file {file_name} skipped (size: {file_size} bytes > 50MB limit)")
                     continue
                 
+                # Skip files whose content was already uploaded this run
+                # (log rotation often leaves identical copies behind)
+                try:
+                    content_key = _log_content_key(log_file, file_size)
+                except OSError:
+                    content_key = None
+                if content_key is not None and content_key in _uploaded_log_keys:
+                    logger.info(f"Skipping duplicate log file: {file_name}")
+                    continue
+
                 logger.info(f"Uploading log file {i}/{len(log_files_to_upload)}: {file_name} ({file_size} bytes)")
                 
-                # Read log file content (safe to read since we checked size)
-                with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    log_content = f.read()
-                
+                # Single read sized from the cached scandir stat - no extra
+                # stat calls or buffered-reader overhead; the bytes must
+                # outlive this call since the client sends them deferred
+                fd = os.open(log_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+                try:
+                    log_content = os.read(fd, file_size)
+                finally:
+                    os.close(fd)
+
                 # Upload as text attachment
                 client.log(
-                    time=timestamp(),
+                    time=now,
                     level="INFO",
                     message=f"[INFO] Jan {app_type} application log: {file_name}",
                     item_id=test_item_id,
                     attachment={
                         "name": f"jan_{app_type}_log_{i}_{file_name}",
-                        "data": log_content.encode('utf-8'),
+                        "data": log_content,
                         "mime": "text/plain"
                     }
                 )
-                
+
+                uploaded_count += 1
+                if content_key is not None:
+                    if len(_uploaded_log_keys) >= _UPLOADED_LOG_KEYS_MAX:
+                        _uploaded_log_keys.clear()
+                    _uploaded_log_keys.add(content_key)
+
                 logger.info(f"Successfully uploaded log: {file_name}")
                 
             except Exception as e:
                 logger.error(f"Error uploading log file {log_file}: {e}")
                 client.log(
-                    time=timestamp(),
+                    time=now,
                     level="ERROR",
                     message=f"Failed to upload log file {os.path.basename(log_file)}: {str(e)}",
                     item_id=test_item_id
                 )
         
-        # Add summary log
-        client.log(
-            time=timestamp(),
-            level="INFO",
-            message=f"[INFO] Uploaded {len(log_files_to_upload)} Jan {app_type} log files (total available: {len(all_log_files)})",
-            item_id=test_item_id
-        )
-        
+        # Add summary note
+        note(f"[INFO] Uploaded {uploaded_count} of {len(log_files_to_upload)} candidate Jan {app_type} log files (total available: {len(all_log_files)})",
+             level="INFO")
+
     except Exception as e:
         logger.error(f"Error processing Jan logs: {e}")
         client.log(
@@ -312,18 +581,13 @@ def upload_test_results_to_rp(client, launch_id, test_path, trajectory_dir, forc
         # Upload video if available
         if video_path and os.path.exists(video_path):
             try:
-                with open(video_path, "rb") as video_file:
-                    client.log(
-                        time=timestamp(),
-                        level="INFO",
-                        message="Screen recording of test execution",
-                        item_id=test_item_id,
-                        attachment={
-                            "name": f"test_recording_{formatted_test_path}.mp4",
-                            "data": video_file.read(),
-                            "mime": "video/x-msvideo"
-                        }
-                    )
+                _log_file_attachment(
+                    client, test_item_id,
+                    message="Screen recording of test execution",
+                    attachment_name=f"test_recording_{formatted_test_path}.mp4",
+                    file_path=video_path,
+                    mime=_video_mime(video_path)
+                )
                 logger.info(f"Uploaded video for failed test: {video_path}")
             except Exception as e:
                 logger.error(f"Error uploading video: {e}")
@@ -336,13 +600,21 @@ def upload_test_results_to_rp(client, launch_id, test_path, trajectory_dir, forc
         return
     
     formatted_test_path = test_path.replace('\\', '/').replace('.txt', '').replace('/', '__')
-    
+
+    # Scan the trajectory once; the listing is shared between result
+    # extraction and the per-turn upload loop below
+    try:
+        turn_dirs = _list_turn_dirs(trajectory_dir)
+    except OSError as e:
+        logger.error(f"Error scanning trajectory directory: {e}")
+        turn_dirs = []
+
     # Determine final status
     if force_stopped:
         final_status = "FAILED"
         status_message = "exceeded maximum turn limit (30 turns)"
     else:
-        test_result = extract_test_result_from_trajectory(trajectory_dir)
+        test_result = extract_test_result_from_trajectory(trajectory_dir, turn_dirs=turn_dirs)
         if test_result is True:
             final_status = "PASSED" 
             status_message = "completed successfully with positive result"
@@ -360,67 +632,69 @@ def upload_test_results_to_rp(client, launch_id, test_path, trajectory_dir, forc
     )
     
     try:
-        turn_folders = [f for f in os.listdir(trajectory_dir) 
-                       if os.path.isdir(os.path.join(trajectory_dir, f)) and f.startswith("turn_")]
-        
         # Add clear status log
         status_emoji = "[SUCCESS]" if final_status == "PASSED" else "[FAILED]"
         client.log(
             time=timestamp(),
             level="INFO" if final_status == "PASSED" else "ERROR",
-            message=f"{status_emoji} TEST {final_status} {status_emoji}\nReason: {status_message}\nTotal turns: {len(turn_folders)}",
+            message=f"{status_emoji} TEST {final_status} {status_emoji}\nReason: {status_message}\nTotal turns: {len(turn_dirs)}",
             item_id=test_item_id
         )
         
+        # Informational/warning notes collected here are posted as one
+        # combined log entry after the uploads, instead of one request each
+        status_lines = []
+
         # Upload screen recording video first
         if video_path and os.path.exists(video_path):
             logger.info(f"Attempting to upload video: {video_path}")
             logger.info(f"Video file size: {os.path.getsize(video_path)} bytes")
             try:
-                with open(video_path, "rb") as video_file:
-                    video_data = video_file.read()
-                    logger.info(f"Read video data: {len(video_data)} bytes")
-                    client.log(
-                        time=timestamp(),
-                        level="INFO",
-                        message="[INFO] Screen recording of test execution",
-                        item_id=test_item_id,
-                        attachment={
-                            "name": f"test_recording_{formatted_test_path}.mp4",
-                            "data": video_data,
-                            "mime": "video/x-msvideo"
-                        }
-                    )
+                _log_file_attachment(
+                    client, test_item_id,
+                    message="[INFO] Screen recording of test execution",
+                    attachment_name=f"test_recording_{formatted_test_path}.mp4",
+                    file_path=video_path,
+                    mime=_video_mime(video_path)
+                )
                 logger.info(f"Successfully uploaded screen recording: {video_path}")
             except Exception as e:
                 logger.error(f"Error uploading screen recording: {e}")
-                client.log(
-                    time=timestamp(),
-                    level="WARNING",
-                    message=f"Failed to upload screen recording: {str(e)}",
-                    item_id=test_item_id
-                )
+                status_lines.append(f"Failed to upload screen recording: {str(e)}")
         else:
             logger.warning(f"Video upload skipped - video_path: {video_path}, exists: {os.path.exists(video_path) if video_path else 'N/A'}")
-            client.log(
-                time=timestamp(),
-                level="WARNING",
-                message="No screen recording available for this test",
-                item_id=test_item_id
-            )
-        
+            status_lines.append("No screen recording available for this test")
+
         # Upload Jan application logs
         logger.info("Uploading Jan application logs...")
-        upload_jan_logs(client, test_item_id, is_nightly=is_nightly, max_log_files=5)
+        upload_jan_logs(client, test_item_id, is_nightly=is_nightly, max_log_files=5,
+                        status_lines=status_lines)
         
         # Upload all turn data with appropriate status
         # If test failed, mark all turns as failed
         force_fail_turns = (final_status == "FAILED")
         
-        for turn_folder in sorted(turn_folders):
-            turn_path = os.path.join(trajectory_dir, turn_folder)
-            upload_turn_folder(client, test_item_id, turn_path, turn_folder, force_fail=force_fail_turns)
-        
+        # Each turn has its own step item, so turns can be uploaded
+        # concurrently; latency drops from N round-trips to ~N/workers
+        if turn_dirs:
+            with ThreadPoolExecutor(max_workers=TURN_UPLOAD_WORKERS) as executor:
+                futures = [
+                    executor.submit(upload_turn_folder, client, test_item_id,
+                                    turn_dir.path, turn_dir.name, force_fail=force_fail_turns)
+                    for turn_dir in turn_dirs
+                ]
+                for future in futures:
+                    future.result()
+
+        # Post the collected informational notes as a single log entry
+        if status_lines:
+            client.log(
+                time=timestamp(),
+                level="INFO",
+                message="\n".join(status_lines),
+                item_id=test_item_id
+            )
+
         # Finish with correct status
         client.finish_test_item(
             item_id=test_item_id,
@@ -436,4 +710,18 @@ def upload_test_results_to_rp(client, launch_id, test_path, trajectory_dir, forc
             item_id=test_item_id,
             end_time=timestamp(),
             status="FAILED"
-        )
\ No newline at end of file
+        )
+
+async def upload_test_results_to_rp_async(client, launch_id, test_path, trajectory_dir,
+                                          force_stopped=False, video_path=None, is_nightly=False):
+    """
+    Async wrapper around upload_test_results_to_rp
+    Runs the whole upload in a worker thread so the caller's event loop
+    stays free while files are read and HTTP posts are in flight; the
+    turn uploads inside already fan out across their own thread pool
+    """
+    await asyncio.to_thread(
+        upload_test_results_to_rp,
+        client, launch_id, test_path, trajectory_dir,
+        force_stopped, video_path, is_nightly
+    )
@@ -10,7 +10,7 @@ from agent import ComputerAgent, LLM
 
 from utils import is_jan_running, force_close_jan, start_jan_app, get_latest_trajectory_folder
 from screen_recorder import ScreenRecorder
-from reportportal_handler import upload_test_results_to_rp
+from reportportal_handler import upload_test_results_to_rp_async
 from reportportal_client.helpers import timestamp
 
 logger = logging.getLogger(__name__)
@@ -213,7 +213,9 @@ async def run_single_test_with_timeout(computer, test_data, rp_client, launch_id
                     logger.info(f"Video exists: {os.path.exists(video_path)}")
                     if os.path.exists(video_path):
                         logger.info(f"Video file size: {os.path.getsize(video_path)} bytes")
-                    upload_test_results_to_rp(rp_client, launch_id, path, trajectory_dir, force_stopped_due_to_turns, video_path, is_nightly)
+                    # Run the upload off the event loop so other coroutines
+                    # aren't blocked while attachments are posted
+                    await upload_test_results_to_rp_async(rp_client, launch_id, path, trajectory_dir, force_stopped_due_to_turns, video_path, is_nightly)
                 else:
                     logger.warning(f"Test completed but no trajectory found for: {path}")
                     # Handle case where test completed but no trajectory found
@@ -243,7 +245,7 @@ async def run_single_test_with_timeout(computer, test_data, rp_client, launch_id
                                     attachment={
                                         "name": f"failed_test_recording_{formatted_test_path}.mp4",
                                         "data": video_file.read(),
-                                        "mime": "video/x-msvideo"
+                                        "mime": "video/mp4"
                                     }
                                 )
                         except Exception as e: